@@ -9,11 +9,12 @@ import com.spellchain.domain.Snapshot;
 import com.spellchain.dto.RoomCreatedMessage;
 import java.security.SecureRandom;
 import java.util.ArrayList;
-import java.util.Collections;
+import java.util.BitSet;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Locale;
 import java.util.Map;
+import java.util.NavigableMap;
 import java.util.NoSuchElementException;
 import java.util.concurrent.ConcurrentHashMap;
 import org.slf4j.Logger;
@@ -51,6 +52,12 @@ public class GameService {
   private final int minPlayers;
   private final int maxPlayers;
   private final String allowedPunctuation;
+  /** Allowed punctuation code points, resolved once from configuration. */
+  private final BitSet allowedPunct = new BitSet();
+  /** Canonical (lower-cased) string for each ASCII code point, or null if it is not allowed. */
+  private final String[] asciiChars = new String[128];
+  private final String roomCreatedSuffix;
+  private final String invalidCharMessage;
 
   public GameService(
       Dictionary dict,
@@ -63,6 +70,12 @@ public class GameService {
     this.minPlayers = minPlayers;
     this.maxPlayers = maxPlayers;
     this.allowedPunctuation = allowedPunctuation;
+    allowedPunctuation.codePoints().forEach(allowedPunct::set);
+    for (int c = 0; c < asciiChars.length; c++) {
+      asciiChars[c] = canonicalChar(c);
+    }
+    this.roomCreatedSuffix = ". Waiting to start (auto-start at " + maxPlayers + ").";
+    this.invalidCharMessage = "Invalid character: enter a single letter or one of " + allowedPunctuation;
   }
 
   /**
@@ -84,13 +97,7 @@ public class GameService {
     try {
       b =
           GameBroadcast.of(id, snap(room))
-              .withMessages(
-                  List.of(
-                      "Room created. Share code: "
-                          + id
-                          + ". Waiting to start (auto-start at "
-                          + maxPlayers
-                          + ")."));
+              .withMessages(List.of("Room created. Share code: " + id + roomCreatedSuffix));
     } finally {
       room.lock().unlock();
     }
@@ -231,6 +238,7 @@ public class GameService {
       throw new IllegalArgumentException("Enter exactly one character");
     }
 
+    roomId = norm(roomId);
     GameRoom room = getRoom(roomId);
     int num = playerNum(room, sid);
     if (num == 0) {
@@ -238,6 +246,9 @@ public class GameService {
     }
 
     GameBroadcast toPublish;
+    List<String> messages = new ArrayList<>();
+    String completed = null;
+    int pts = 0;
     room.lock().lock();
     try {
       if (!room.started()) {
@@ -250,37 +261,27 @@ public class GameService {
         throw new IllegalStateException("Not your turn.");
       }
 
-      // Unicode-safe lower-casing by code point
       int cp = ch.codePointAt(0);
-      int lower = Character.toLowerCase(cp);
-      String chStr = new String(Character.toChars(lower));
-
-      boolean isLetter = Character.isLetter(lower);
-      boolean isAllowedPunct = chStr.length() == 1 && allowedPunctuation.indexOf(chStr.charAt(0)) >= 0;
-      if (!(isLetter || isAllowedPunct)) {
-        throw new IllegalArgumentException("Invalid character: enter a single letter or one of " + allowedPunctuation);
+      String chStr = cp < asciiChars.length ? asciiChars[cp] : canonicalChar(cp);
+      if (chStr == null) {
+        throw new IllegalArgumentException(invalidCharMessage);
       }
 
       String cand = room.sequence() + chStr;
-      List<String> messages = new ArrayList<>();
+      Dictionary.Match match = dict.match(cand);
 
-      if (dict.isWord(cand)) {
-        boolean used = room.words().values().stream().anyMatch(s -> s.contains(cand));
-        if (!used) {
-          int pts = Math.max((cand.length() + 1) / 2, 1);
+      if (match.word()) {
+        if (room.usedWords().add(cand)) {
+          pts = Math.max((cand.length() + 1) / 2, 1);
           room.scores().merge(num, pts, Integer::sum);
           room.words().get(num).add(cand);
-          String def = dict.definition(cand);
-          messages.add(
-              String.format(
-                  "*** Player %d completed \"%s\"! (%d Point%s) *** Definition: %s",
-                  num, cand, pts, (pts != 1 ? "s" : ""), (def != null ? def : "No definition available.")));
+          completed = cand;
         } else {
           messages.add("\"" + cand + "\" has already been used. No points this round.");
         }
       }
 
-      if (!dict.hasPrefix(cand)) {
+      if (!match.prefix()) {
         messages.add("\"" + cand + "\" is not a valid prefix. Round over. Sequence reset.");
         room.sequence("");
         room.round(room.round() + 1);
@@ -289,15 +290,22 @@ public class GameService {
       }
 
       room.current(nextActive(room));
-      toPublish =
-          GameBroadcast.of(room.id(), snap(room))
-              .withLastMove(num, chStr)
-              .withMessages(messages);
+      toPublish = GameBroadcast.of(room.id(), snap(room)).withLastMove(num, chStr);
     } finally {
       room.lock().unlock();
     }
-    publisher.publish(toPublish);
-    log.info("Room {} p#{} '{}' processed", roomId, num, ch);
+
+    // The definition is only needed for the message text, so fetch it without holding the room lock.
+    if (completed != null) {
+      String def = dict.definition(completed);
+      messages.add(
+          0,
+          "*** Player " + num + " completed \"" + completed + "\"! (" + pts + " Point"
+              + (pts != 1 ? "s" : "") + ") *** Definition: "
+              + (def != null ? def : "No definition available."));
+    }
+    publisher.publish(toPublish.withMessages(messages));
+    log.debug("Room {} p#{} '{}' processed", roomId, num, ch);
   }
 
   /**
@@ -362,9 +370,21 @@ public class GameService {
     return id == null ? null : id.trim().toUpperCase(Locale.ROOT);
   }
 
-  /** Retrieve a room by id or throw. */
+  /**
+   * Lower-case a code point (Unicode-safe) and return it as a string if it is a letter or allowed
+   * punctuation.
+   *
+   * @return canonical single-character string, or null if the character is not allowed
+   */
+  private String canonicalChar(int cp) {
+    int lower = Character.toLowerCase(cp);
+    if (!Character.isLetter(lower) && !allowedPunct.get(lower)) return null;
+    return new String(Character.toChars(lower));
+  }
+
+  /** Retrieve a room by normalized id or throw. */
   private GameRoom getRoom(String id) {
-    GameRoom r = rooms.get(norm(id));
+    GameRoom r = rooms.get(id);
     if (r == null) throw new NoSuchElementException("Room not found");
     return r;
   }
@@ -375,11 +395,7 @@ public class GameService {
    * @return player number in the room, or 0 if the session is not present
    */
   private int playerNum(GameRoom room, String sid) {
-    return room.players().entrySet().stream()
-        .filter(e -> sid.equals(e.getValue().sessionId()))
-        .map(Map.Entry::getKey)
-        .findFirst()
-        .orElse(0);
+    return room.playerNumber(sid);
   }
 
   /** Generate a new unique 6-character room id. */
@@ -397,18 +413,16 @@ public class GameService {
   /** Mark room as started and set current player to the lowest-numbered active player. */
   private void startInternal(GameRoom room) {
     room.started(true);
-    int first = room.players().keySet().stream().min(Integer::compareTo).orElse(1);
+    int first = room.players().isEmpty() ? 1 : room.players().firstKey();
     room.current(first);
   }
 
   /** Return the next active player after the current player (wrap-around). */
   private int nextActive(GameRoom room) {
-    List<Integer> active = new ArrayList<>(room.players().keySet());
-    Collections.sort(active);
+    NavigableMap<Integer, Player> active = room.players();
     if (active.isEmpty()) return 1;
-    int cur = room.current();
-    int idx = active.indexOf(cur);
-    return (idx < 0) ? active.get(0) : active.get((idx + 1) % active.size());
+    Integer next = active.higherKey(room.current());
+    return next != null ? next : active.firstKey();
   }
 
   /** Create an immutable snapshot of the room's current visible state. */
@@ -6,4 +6,11 @@ public interface Dictionary {
   boolean hasPrefix(String p);
 
   String definition(String w);
-}
\ No newline at end of file
+
+  /** Word and prefix status of a sequence, resolved in a single lookup. */
+  default Match match(String s) {
+    return new Match(isWord(s), hasPrefix(s));
+  }
+
+  record Match(boolean word, boolean prefix) {}
+}
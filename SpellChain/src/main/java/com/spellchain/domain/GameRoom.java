@@ -1,18 +1,21 @@
 package com.spellchain.domain;
 
-import java.util.Collections;
 import java.util.HashSet;
 import java.util.Map;
+import java.util.NavigableMap;
 import java.util.Set;
 import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentSkipListMap;
 import java.util.concurrent.locks.ReentrantLock;
 
 public class GameRoom {
   private final String id;
   private final int capacity;
-  private final Map<Integer, Player> players = new ConcurrentHashMap<>();
+  private final NavigableMap<Integer, Player> players = new ConcurrentSkipListMap<>();
+  private final Map<String, Integer> seats = new ConcurrentHashMap<>();
   private final Map<Integer, Integer> scores = new ConcurrentHashMap<>();
   private final Map<Integer, Set<String>> words = new ConcurrentHashMap<>();
+  private final Set<String> usedWords = new HashSet<>();
   private final ReentrantLock lock = new ReentrantLock();
 
   private String sequence = "";
@@ -33,18 +36,30 @@ public class GameRoom {
     return capacity;
   }
 
-  public Map<Integer, Player> players() {
+  /** Players keyed by number, iterated in ascending seat order. */
+  public NavigableMap<Integer, Player> players() {
     return players;
   }
 
+  /** Player number for a session, or 0 if the session is not in this room. */
+  public int playerNumber(String sessionId) {
+    return seats.getOrDefault(sessionId, 0);
+  }
+
   public Map<Integer, Integer> scores() {
     return scores;
   }
 
+  /** Found words per player; the sets are only mutated under the room lock. */
   public Map<Integer, Set<String>> words() {
     return words;
   }
 
+  /** Union of all players' found words; guarded by the room lock. */
+  public Set<String> usedWords() {
+    return usedWords;
+  }
+
   public ReentrantLock lock() {
     return lock;
   }
@@ -83,20 +98,24 @@ public class GameRoom {
 
   public void addPlayer(int n, Player p) {
     players.put(n, p);
+    seats.put(p.sessionId(), n);
     scores.putIfAbsent(n, 0);
-    words.putIfAbsent(n, Collections.synchronizedSet(new HashSet<>()));
+    words.putIfAbsent(n, new HashSet<>());
   }
 
   public void removePlayer(int n) {
-    players.remove(n);
+    Player p = players.remove(n);
+    if (p != null) seats.remove(p.sessionId());
     scores.remove(n);
     words.remove(n);
   }
 
   public void removeAll() {
     players.clear();
+    seats.clear();
     scores.clear();
     words.clear();
+    usedWords.clear();
     sequence = "";
     round = 1;
     current = 1;
@@ -2,6 +2,7 @@ package com.spellchain.domain;
 
 import java.util.Map;
 
+/** Immutable view of a room's visible state; {@code scores} is a private copy owned by the snapshot. */
 public record Snapshot(
     boolean started,
     int capacity,
@@ -1,8 +1,10 @@
 package com.spellchain.dto;
 
+import com.fasterxml.jackson.annotation.JsonInclude;
 import java.util.List;
 import java.util.Map;
 
+@JsonInclude(JsonInclude.Include.NON_NULL)
 public record GameUpdateMessage(
     String type,
     Integer player,
@@ -16,56 +18,21 @@ public record GameUpdateMessage(
     Integer joinedCount,
     Integer hostPlayer) {
 
-  public static GameUpdateMessage base(Boolean started, Integer cap, Integer joined, Integer host) {
+  public static GameUpdateMessage of(
+      Integer player,
+      String ch,
+      List<String> messages,
+      int currentPlayer,
+      String sequence,
+      Map<Integer, Integer> scores,
+      int roundCount,
+      boolean started,
+      int joinedCount,
+      int hostPlayer) {
     return new GameUpdateMessage(
         "game_update",
-        null,
-        null,
-        null,
-        null,
-        null,
-        null,
-        null,
-        started,
-        joined,
-        host);
-  }
-
-  public GameUpdateMessage withMessages(List<String> msgs) {
-    return new GameUpdateMessage(
-        type,
         player,
         ch,
-        msgs,
-        currentPlayer,
-        sequence,
-        scores,
-        roundCount,
-        started,
-        joinedCount,
-        hostPlayer);
-  }
-
-  public GameUpdateMessage withSnapshot(int cur, String seq, Map<Integer, Integer> sc, int round) {
-    return new GameUpdateMessage(
-        type,
-        player,
-        ch,
-        messages,
-        cur,
-        seq,
-        sc,
-        round,
-        started,
-        joinedCount,
-        hostPlayer);
-  }
-
-  public GameUpdateMessage withLastMove(int lastPlayer, String lastCh) {
-    return new GameUpdateMessage(
-        type,
-        lastPlayer,
-        lastCh,
         messages,
         currentPlayer,
         sequence,
@@ -75,4 +42,4 @@ public record GameUpdateMessage(
         joinedCount,
         hostPlayer);
   }
-}
\ No newline at end of file
+}
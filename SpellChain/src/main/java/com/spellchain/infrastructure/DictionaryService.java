@@ -6,7 +6,12 @@ import jakarta.annotation.PreDestroy;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.sql.*;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.LinkedHashMap;
+import java.util.List;
 import java.util.Locale;
+import java.util.Map;
 import java.util.Objects;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
@@ -18,30 +23,46 @@ import org.sqlite.SQLiteOpenMode;
 /**
  * Dictionary implementation backed by a read-only SQLite database.
  *
- * <p>This service opens a read-only JDBC connection to an existing SQLite dictionary and performs
- * all lookups via parameterized SQL queries for safety and simplicity. Inputs are normalized to
- * lower-case (Locale.ROOT). Prefix queries use SQLite LIKE with an explicit ESCAPE clause, and user
- * input is escaped to avoid wildcard interpretation.
+ * <p>This service opens a read-only JDBC connection to an existing SQLite dictionary. The word
+ * column is read once at startup into a sorted in-memory index shared by all rooms, so word and
+ * prefix checks are binary searches rather than SQL scans (the dict table has no index).
+ * Definitions stay in SQLite and are fetched via a parameterized statement that is prepared once
+ * and reused under the connection lock; recently fetched definitions are kept in a small LRU
+ * cache. Inputs are normalized to lower-case (Locale.ROOT).
  */
 @Service
 public class DictionaryService implements Dictionary {
   private static final Logger log = LoggerFactory.getLogger(DictionaryService.class);
 
-  private static final String SQL_IS_WORD = "SELECT 1 FROM dict WHERE word = ? LIMIT 1";
-  private static final String SQL_HAS_PREFIX = "SELECT 1 FROM dict WHERE word LIKE ? ESCAPE '\\' LIMIT 1";
+  private static final String SQL_ALL_WORDS = "SELECT word FROM dict WHERE word IS NOT NULL";
   private static final String SQL_DEF_BY_WORD = "SELECT def FROM dict WHERE word = ?";
+  private static final Match NO_MATCH = new Match(false, false);
+  private static final int DEF_CACHE_SIZE = 4096;
 
   private final String jdbcUrl;
   private final Object lock = new Object();
   
   private Connection conn;
+  private PreparedStatement defStmt;
+
+  /** All dictionary words, sorted and de-duplicated; immutable once published. */
+  private volatile String[] words = new String[0];
+
+  /** Recently shown definitions (access-ordered LRU); guarded by {@link #lock}. */
+  private final Map<String, String> defCache =
+      new LinkedHashMap<>(256, 0.75f, true) {
+        @Override
+        protected boolean removeEldestEntry(Map.Entry<String, String> e) {
+          return size() > DEF_CACHE_SIZE;
+        }
+      };
 
   public DictionaryService(@Value("${spellchain.dictionary-jdbc-url}") String jdbcUrl) {
     this.jdbcUrl = Objects.requireNonNull(jdbcUrl, "spellchain.dictionary-jdbc-url");
   }
 
   /**
-   * Open a read-only SQLite connection and apply conservative PRAGMAs.
+   * Open a read-only SQLite connection, apply conservative PRAGMAs, and build the word index.
    *
    * <p>If the JDBC URL points to a file path, the file's existence is verified. The connection is
    * configured as read-only and set to auto-commit. The following PRAGMAs are set:
@@ -81,24 +102,27 @@ public class DictionaryService implements Dictionary {
         s.execute("PRAGMA cache_size=20000");
       }
 
+      defStmt = conn.prepareStatement(SQL_DEF_BY_WORD);
+      words = loadWords();
+
       long ms = (System.nanoTime() - t0) / 1_000_000;
-      log.info("Dictionary DB ready ({} ms). Using SQL lookups only.", ms);
+      log.info("Dictionary DB ready ({} ms). {} words indexed in memory.", ms, words.length);
     } catch (Exception e) {
       close();
       throw e;
     }
   }
 
-  /** Close the SQLite connection.*/
+  /** Close the prepared statements and the SQLite connection.*/
   @PreDestroy
   public void close() {
     synchronized (lock) {
-      try {
-        if (conn != null) conn.close();
-      } catch (Exception ignore) {
-        // ignore
-      }
+      closeQuietly(defStmt);
+      closeQuietly(conn);
+      defStmt = null;
       conn = null;
+      words = new String[0];
+      defCache.clear();
     }
   }
 
@@ -110,9 +134,7 @@ public class DictionaryService implements Dictionary {
    */
   @Override
   public boolean isWord(String w) {
-    String word = norm(w);
-    if (word == null) return false;
-    return exists(SQL_IS_WORD, word, "isWord");
+    return match(w).word();
   }
 
   /**
@@ -123,10 +145,24 @@ public class DictionaryService implements Dictionary {
    */
   @Override
   public boolean hasPrefix(String p) {
-    String prefix = norm(p);
-    if (prefix == null) return false;
-    String like = escapeLike(prefix) + "_%";
-    return exists(SQL_HAS_PREFIX, like, "hasPrefix");
+    return match(p).prefix();
+  }
+
+  /**
+   * Resolve word and prefix status with a single binary search.
+   *
+   * @param s sequence to check (may be null)
+   * @return whether s is a word and whether a longer word starts with s
+   */
+  @Override
+  public Match match(String s) {
+    String key = norm(s);
+    if (key == null) return NO_MATCH;
+    String[] ws = words;
+    // The first entry sorting after the key itself is the smallest longer word, if any exists.
+    int i = Arrays.binarySearch(ws, key);
+    int next = i >= 0 ? i + 1 : -i - 1;
+    return new Match(i >= 0, next < ws.length && ws[next].startsWith(key));
   }
 
   /**
@@ -139,44 +175,45 @@ public class DictionaryService implements Dictionary {
   public String definition(String w) {
     String word = norm(w);
     if (word == null) return null;
-    return queryString(SQL_DEF_BY_WORD, word, "definition");
+    synchronized (lock) {
+      String def = defCache.get(word);
+      if (def == null) {
+        def = queryString(defStmt, word, "definition");
+        if (def != null) defCache.put(word, def);
+      }
+      return def;
+    }
   }
 
-  /** 
-   * Execute a simple existence check returning true if at least one row matches.
-   * 
-   * @param sql SQL query with one parameter
-   * @param param parameter value
-   * @param op operation name for logging
-   * @return true if at least one row matches
+  /**
+   * Read every word from the dict table into a sorted, de-duplicated array.
+   *
+   * @return sorted word array suitable for binary search
+   * @throws SQLException if the query fails
    */
-  private boolean exists(String sql, String param, String op) {
-    synchronized (lock) {
-      if (conn == null) return false;
-      try (PreparedStatement ps = conn.prepareStatement(sql)) {
-        ps.setString(1, param);
-        try (ResultSet rs = ps.executeQuery()) {
-          return rs.next();
-        }
-      } catch (SQLException e) {
-        log.debug("{} lookup failed for '{}': {}", op, param, e.getMessage());
-        return false;
+  private String[] loadWords() throws SQLException {
+    List<String> all = new ArrayList<>(1 << 16);
+    try (Statement s = conn.createStatement();
+        ResultSet rs = s.executeQuery(SQL_ALL_WORDS)) {
+      while (rs.next()) {
+        all.add(rs.getString(1));
       }
     }
+    return all.stream().sorted().distinct().toArray(String[]::new);
   }
 
   /** 
    * Execute a single-column string query and return the first result or null.
    * 
-   * @param sql SQL query with one parameter
+   * @param ps prepared query with one parameter
    * @param param parameter value
    * @param op operation name for logging
    * @return query result string or null
    */
-  private String queryString(String sql, String param, String op) {
+  private String queryString(PreparedStatement ps, String param, String op) {
     synchronized (lock) {
       if (conn == null) return null;
-      try (PreparedStatement ps = conn.prepareStatement(sql)) {
+      try {
         ps.setString(1, param);
         try (ResultSet rs = ps.executeQuery()) {
           if (rs.next()) {
@@ -191,15 +228,19 @@ public class DictionaryService implements Dictionary {
     }
   }
 
+  /** Close a JDBC resource, ignoring failures. */
+  private static void closeQuietly(AutoCloseable c) {
+    try {
+      if (c != null) c.close();
+    } catch (Exception ignore) {
+      // ignore
+    }
+  }
+
   /** Normalize input string by lower-casing (Locale.ROOT). */
   private static String norm(String s) {
     if (s == null) return null;
     String n = s.toLowerCase(Locale.ROOT);
     return n.isEmpty() ? null : n;
   }
-
-  /** Escape special LIKE wildcard characters in user input. */
-  private static String escapeLike(String s) {
-    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_");
-  }
 }
\ No newline at end of file
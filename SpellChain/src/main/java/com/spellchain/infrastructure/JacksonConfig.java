@@ -0,0 +1,22 @@
+package com.spellchain.infrastructure;
+
+import com.fasterxml.jackson.databind.Module;
+import com.fasterxml.jackson.module.blackbird.BlackbirdModule;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+
+/**
+ * Jackson tuning for the STOMP message converter.
+ *
+ * <p>Spring Boot registers every {@link Module} bean with the shared ObjectMapper, which is also
+ * used to serialize room broadcasts and deserialize client requests. Blackbird replaces reflective
+ * record accessor calls with generated lambdas, cutting per-message (de)serialization cost.
+ */
+@Configuration
+public class JacksonConfig {
+
+  @Bean
+  public Module blackbirdModule() {
+    return new BlackbirdModule();
+  }
+}
@@ -4,7 +4,7 @@ import com.spellchain.application.port.GamePublisher;
 import com.spellchain.domain.GameBroadcast;
 import com.spellchain.domain.Snapshot;
 import com.spellchain.dto.GameUpdateMessage;
-import java.util.HashMap;
+import java.util.List;
 import org.springframework.messaging.simp.SimpMessagingTemplate;
 import org.springframework.stereotype.Component;
 
@@ -19,19 +19,20 @@ public class StompGamePublisher implements GamePublisher {
   @Override
   public void publish(GameBroadcast b) {
     Snapshot s = b.snapshot();
+    boolean moved = b.lastPlayer() != null || b.lastCh() != null;
+    List<String> msgs = (b.messages() != null && !b.messages().isEmpty()) ? b.messages() : null;
     GameUpdateMessage m =
-        GameUpdateMessage.base(s.started(), s.capacity(), s.joined(), s.host())
-            .withSnapshot(
-                s.current() == null ? 0 : s.current(),
-                s.sequence() == null ? "" : s.sequence(),
-                new HashMap<>(s.scores()),
-                s.round());
-    if (b.lastPlayer() != null || b.lastCh() != null) {
-      m = m.withLastMove(b.lastPlayer() == null ? 0 : b.lastPlayer(), b.lastCh());
-    }
-    if (b.messages() != null && !b.messages().isEmpty()) {
-      m = m.withMessages(b.messages());
-    }
+        GameUpdateMessage.of(
+            moved ? (b.lastPlayer() == null ? 0 : b.lastPlayer()) : null,
+            moved ? b.lastCh() : null,
+            msgs,
+            s.current() == null ? 0 : s.current(),
+            s.sequence() == null ? "" : s.sequence(),
+            s.scores(),
+            s.round(),
+            s.started(),
+            s.joined(),
+            s.host());
     ws.convertAndSend("/topic/rooms/" + b.roomId(), m);
   }
-}
\ No newline at end of file
+}
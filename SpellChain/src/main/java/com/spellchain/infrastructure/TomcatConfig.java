@@ -0,0 +1,26 @@
+package com.spellchain.infrastructure;
+
+import org.springframework.boot.web.embedded.tomcat.TomcatServletWebServerFactory;
+import org.springframework.boot.web.server.WebServerFactoryCustomizer;
+import org.springframework.stereotype.Component;
+
+/**
+ * Socket options for the embedded Tomcat connector that carries the WebSocket traffic.
+ *
+ * <p>Game traffic consists of small STOMP frames (one per move plus one broadcast per player).
+ * TCP_NODELAY is Tomcat's default; it is pinned here so small frames keep bypassing Nagle's
+ * algorithm even if the container default changes. Keep-alive probes let the kernel detect peers
+ * that vanished without closing the connection.
+ */
+@Component
+public class TomcatConfig implements WebServerFactoryCustomizer<TomcatServletWebServerFactory> {
+
+  @Override
+  public void customize(TomcatServletWebServerFactory factory) {
+    factory.addConnectorCustomizers(
+        c -> {
+          c.setProperty("socket.tcpNoDelay", "true");
+          c.setProperty("socket.soKeepAlive", "true");
+        });
+  }
+}
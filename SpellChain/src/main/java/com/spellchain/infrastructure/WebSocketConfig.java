@@ -1,15 +1,20 @@
 package com.spellchain.infrastructure;
 
 import org.springframework.beans.factory.annotation.Value;
+import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
 import org.springframework.messaging.simp.config.MessageBrokerRegistry;
 import org.springframework.web.socket.config.annotation.EnableWebSocketMessageBroker;
 import org.springframework.web.socket.config.annotation.StompEndpointRegistry;
 import org.springframework.web.socket.config.annotation.WebSocketMessageBrokerConfigurer;
+import org.springframework.web.socket.config.annotation.WebSocketTransportRegistration;
+import org.springframework.web.socket.server.standard.ServletServerContainerFactoryBean;
 
 @Configuration
 @EnableWebSocketMessageBroker
 public class WebSocketConfig implements WebSocketMessageBrokerConfigurer {
+  /** Client frames carry a room code and at most one character, so a small fixed cap suffices. */
+  private static final int MAX_INBOUND_MESSAGE = 4 * 1024;
 
   @Value("${spellchain.allowed-origins:*}")
   private String allowedOrigins;
@@ -26,4 +31,17 @@ public class WebSocketConfig implements WebSocketMessageBrokerConfigurer {
     String[] origins = allowedOrigins.split("\\s*,\\s*");
     r.addEndpoint("/ws").setAllowedOriginPatterns(origins);
   }
+
+  @Override
+  public void configureWebSocketTransport(WebSocketTransportRegistration r) {
+    r.setMessageSizeLimit(MAX_INBOUND_MESSAGE);
+  }
+
+  @Bean
+  public ServletServerContainerFactoryBean webSocketContainer() {
+    ServletServerContainerFactoryBean c = new ServletServerContainerFactoryBean();
+    c.setMaxTextMessageBufferSize(MAX_INBOUND_MESSAGE);
+    c.setMaxBinaryMessageBufferSize(MAX_INBOUND_MESSAGE);
+    return c;
+  }
 }
\ No newline at end of file